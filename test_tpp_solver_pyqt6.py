@@ -0,0 +1,71 @@
+import os
+import unittest
+
+import numpy as np
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen") # Runs without a display
+
+try:
+    from PyQt6.QtWidgets import QApplication
+    import tpp_solver_pyqt6 as gui
+except ImportError:
+    gui = None
+
+
+@unittest.skipUnless(gui, "PyQt6 is needed for the GUI")
+class ForbiddenRouteInputTest(unittest.TestCase):
+    """A cost cell set to "-" is a forbidden route that reaches the solver as inf"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.window = gui.NativeTransportApp()
+        self.window.spin_rows.setValue(2)
+        self.window.spin_cols.setValue(2)
+        self.window.generate_grid()
+        self.model = self.window.model
+        # Collect rejection messages instead of opening the window's modal dialog
+        self.model.invalid_input.disconnect(self.window._input_rejected)
+        self.messages = []
+        self.model.invalid_input.connect(self.messages.append)
+
+    def set_cell(self, r, c, text):
+        return self.model.setData(self.model.index(r, c), text)
+
+    def test_dash_marks_a_cost_cell_forbidden(self):
+        self.assertTrue(self.set_cell(0, 1, " - "))
+        self.assertTrue(self.model.forbidden[0, 1])
+        self.assertEqual(self.model.data(self.model.index(0, 1)), "-")
+
+        # A number makes the route usable again
+        self.assertTrue(self.set_cell(0, 1, "7"))
+        self.assertFalse(self.model.forbidden[0, 1])
+        self.assertEqual(self.model.costs[0, 1], 7)
+        self.assertEqual(self.messages, [])
+
+    def test_dash_is_rejected_for_supply_and_demand(self):
+        self.assertFalse(self.set_cell(0, 2, "-"))
+        self.assertFalse(self.set_cell(2, 0, "-"))
+        self.assertEqual(len(self.messages), 2)
+        self.assertFalse(self.model.forbidden.any())
+
+    def test_forbidden_cells_reach_the_solver_as_inf(self):
+        for (r, c), text in {(0, 0): "4", (0, 1): "-", (1, 0): "3", (1, 1): "6",
+                             (0, 2): "5", (1, 2): "5", (2, 0): "5", (2, 1): "5"}.items():
+            self.assertTrue(self.set_cell(r, c, text))
+
+        started = []
+        self.window._start_solver = lambda *problem: started.append(problem)
+        self.window.run_solver()
+
+        (costs, supply, demand), = started
+        np.testing.assert_array_equal(costs, [[4, np.inf], [3, 6]])
+        allocation, cost, logs = gui.TransportationSolver(costs, supply, demand).solve()
+        np.testing.assert_array_equal(allocation, [[5, 0], [0, 5]])
+        self.assertEqual(cost, 50)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,125 @@
+import unittest
+
+import numpy as np
+
+from transport_solver import TransportationSolver, HAVE_HIGHS
+
+try:
+    from scipy.optimize import linprog
+except ImportError:
+    linprog = None
+
+
+def random_problem(rng, rows, cols):
+    """Balanced problem drawn like the GUI's "Random Balanced Data" button"""
+    costs = rng.integers(10, 101, (rows, cols))
+    supply = rng.integers(20, 101, rows)
+    demand = rng.integers(20, 101, cols)
+    diff = supply.sum() - demand.sum()
+    if diff > 0:
+        demand[rng.integers(cols)] += diff
+    else:
+        supply[rng.integers(rows)] -= diff
+    return costs, supply, demand
+
+
+def degenerate_problems(rng, rows):
+    """Problems whose supply and demand prefix sums coincide, so NWCM starts degenerate"""
+    supply = rng.integers(1, 30, rows)
+    supply[rng.integers(rows)] = 0
+    # Demand equal to supply: every NWCM step exhausts a row and a column at once
+    yield rng.integers(1, 50, (rows, rows)), supply, supply.copy()
+    # Demand merging neighbouring supplies: every second step is degenerate
+    merged = np.add.reduceat(supply, np.arange(0, rows, 2))
+    yield rng.integers(1, 50, (rows, len(merged))), supply, merged
+
+
+def reference_cost(costs, supply, demand):
+    """Optimal cost from a plain dense linprog formulation, independent of the solver.
+    Non-finite costs are routes fixed at 0; None when no feasible allocation exists."""
+    costs = np.asarray(costs, dtype=float)
+    rows, cols = costs.shape
+    allowed = np.isfinite(costs).ravel()
+    A_eq = np.zeros((rows + cols, rows * cols))
+    for r in range(rows):
+        A_eq[r, r * cols:(r + 1) * cols] = 1
+    for c in range(cols):
+        A_eq[rows + c, c::cols] = 1
+    res = linprog(np.where(allowed, costs.ravel(), 0.0), A_eq=A_eq, b_eq=np.concatenate([supply, demand]),
+                  bounds=[(0, None if ok else 0) for ok in allowed], method='highs')
+    return res.fun if res.success else None
+
+
+@unittest.skipUnless(HAVE_HIGHS, "SciPy is needed for the HiGHS path and the reference LP")
+class SolverAgreementTest(unittest.TestCase):
+    """solve_modi and solve_highs must both reach the linprog optimum"""
+
+    def assert_solves(self, costs, supply, demand):
+        expected = reference_cost(costs, supply, demand)
+        self.assertIsNotNone(expected)
+        for method in ("solve_modi", "solve_highs"):
+            with self.subTest(method=method, shape=costs.shape):
+                allocation, cost, logs = getattr(TransportationSolver(costs, supply, demand), method)()
+                np.testing.assert_allclose(allocation.sum(axis=1), supply)
+                np.testing.assert_allclose(allocation.sum(axis=0), demand)
+                self.assertTrue((allocation >= 0).all())
+                self.assertAlmostEqual(cost, expected, places=6)
+
+    def test_random_instances(self):
+        rng = np.random.default_rng(0)
+        for _ in range(60):
+            rows, cols = rng.integers(2, 13, 2)
+            self.assert_solves(*random_problem(rng, rows, cols))
+
+    def test_degenerate_instances(self):
+        rng = np.random.default_rng(1)
+        for _ in range(30):
+            for problem in degenerate_problems(rng, int(rng.integers(2, 11))):
+                self.assert_solves(*problem)
+
+
+@unittest.skipUnless(HAVE_HIGHS, "SciPy is needed for the HiGHS path and the reference LP")
+class ForbiddenRouteTest(unittest.TestCase):
+    """Non-finite costs are routes fixed at 0, in both modes and across split tableaus"""
+
+    def assert_matches_reference(self, costs, supply, demand):
+        expected = reference_cost(costs, supply, demand)
+        forbidden = ~np.isfinite(costs)
+        for teaching in (False, True):
+            with self.subTest(teaching=teaching, costs=costs.tolist()):
+                solver = TransportationSolver(costs, supply, demand, teaching=teaching)
+                if expected is None:
+                    with self.assertRaises(ValueError):
+                        solver.solve()
+                    continue
+                allocation, cost, logs = solver.solve()
+                np.testing.assert_allclose(allocation.sum(axis=1), supply)
+                np.testing.assert_allclose(allocation.sum(axis=0), demand)
+                self.assertFalse(allocation[forbidden].any())
+                self.assertAlmostEqual(cost, expected, places=6)
+                self.assertEqual(solver.basic_count, int(solver.is_basic.sum()))
+
+    def test_connected_tableau(self):
+        self.assert_matches_reference(np.array([[1, np.inf], [3, 4]]), [5, 5], [5, 5])
+
+    def test_split_tableau_with_forbidden_cells_left_inside(self):
+        costs = np.array([[1, 2, np.inf], [3, np.inf, np.inf], [np.inf, np.inf, 5]])
+        self.assert_matches_reference(costs, [4, 3, 6], [5, 2, 6])
+
+    def test_unbalanced_part_raises(self):
+        with self.assertRaises(ValueError):
+            TransportationSolver(np.array([[1, np.inf], [np.inf, 4]]), [5, 5], [3, 7]).solve()
+
+    def test_random_forbidden_cells(self):
+        rng = np.random.default_rng(2)
+        for _ in range(60):
+            rows, cols = rng.integers(2, 9, 2)
+            costs = rng.integers(1, 60, (rows, cols)).astype(float)
+            costs[rng.random((rows, cols)) < rng.uniform(0, 0.6)] = np.inf
+            supply = rng.integers(1, 40, rows)
+            demand = rng.multinomial(supply.sum(), np.ones(cols) / cols)
+            self.assert_matches_reference(costs, supply, demand)
+
+
+if __name__ == "__main__":
+    unittest.main()
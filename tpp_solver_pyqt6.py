@@ -1,353 +1,206 @@
 import sys
-import random
+import numpy as np
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
-                             QHBoxLayout, QLabel, QPushButton, QTableWidget, 
-                             QTableWidgetItem, QTextEdit, QHeaderView, QMessageBox, 
-                             QGroupBox, QSpinBox, QSplitter)
-from PyQt6.QtCore import Qt, QTimer
-from PyQt6.QtGui import QFont, QColor, QBrush
+                             QHBoxLayout, QLabel, QPushButton, QTableView, 
+                             QTextEdit, QHeaderView, QMessageBox, 
+                             QGroupBox, QSpinBox, QSplitter, QProgressBar, QCheckBox)
+from PyQt6.QtCore import Qt, QTimer, QObject, QThread, pyqtSignal, QAbstractTableModel, QModelIndex
+from PyQt6.QtGui import QFont, QColor, QBrush, QTextCursor
+
+from transport_solver import TransportationSolver, HAVE_HIGHS
 
 # ==========================================
-#  BACKEND LOGIC (Unchanged)
+#  RESIZABLE GUI
 # ==========================================
-# class TransportationSolver:
-#     def __init__(self, costs, supply, demand):
-#         self.costs = costs
-#         self.supply = list(supply)
-#         self.demand = list(demand)
-#         self.rows = len(costs)
-#         self.cols = len(costs[0])
-#         self.allocation = [[0 for _ in range(self.cols)] for _ in range(self.rows)]
-#         self.logs = [] 
-
-#     def log(self, message, style="normal"):
-#         self.logs.append((message, style))
-
-#     def solve(self):
-#         self.log("Initializing Basic Feasible Solution (NWCM)...", "header")
-#         self.nwcm()
-#         initial_cost = self.calculate_total_cost()
-#         self.log(f"Initial BFS Cost: Rs. {initial_cost}", "bold")
-
-#         iteration = 1
-#         while True:
-#             self.log(f"--- Optimization Iteration {iteration} ---", "header")
-#             self.fix_degeneracy()
-#             u, v = self.calculate_uv()
-            
-#             if u is None: 
-#                 self.log("Graph disconnected (Degeneracy error). Stopping.", "error")
-#                 break
-
-#             min_d = 0
-#             entering_cell = None
-
-#             for r in range(self.rows):
-#                 for c in range(self.cols):
-#                     if self.allocation[r][c] == 0:
-#                         d_val = self.costs[r][c] - (u[r] + v[c])
-#                         if d_val < min_d:
-#                             min_d = d_val
-#                             entering_cell = (r, c)
-
-#             if min_d >= -1e-9: 
-#                 self.log("All opportunity costs >= 0. Solution is Optimal!", "success")
-#                 break
-            
-#             self.log(f"Negative opp. cost ({min_d}) at {entering_cell}. Improving...", "highlight")
-
-#             path = self.get_closed_loop(entering_cell)
-#             if not path:
-#                 self.log("Closed loop not found. Stopping.", "error")
-#                 break
-
-#             minus_cells_values = []
-#             for i in range(1, len(path), 2):
-#                 r, c = path[i]
-#                 minus_cells_values.append(self.allocation[r][c])
-            
-#             theta = min(minus_cells_values)
-#             self.log(f"Shifting {theta} units along the loop.", "normal")
-
-#             for i, (r, c) in enumerate(path):
-#                 if i % 2 == 0: self.allocation[r][c] += theta
-#                 else: self.allocation[r][c] -= theta
-
-#             iteration += 1
-
-#         return self.allocation, round(self.calculate_total_cost(),0), self.logs
-
-#     def nwcm(self):
-#         r, c = 0, 0
-#         cur_supply, cur_demand = list(self.supply), list(self.demand)
-#         while r < self.rows and c < self.cols:
-#             qty = min(cur_supply[r], cur_demand[c])
-#             self.allocation[r][c] = qty
-#             cur_supply[r] -= qty
-#             cur_demand[c] -= qty
-#             if cur_supply[r] == 0: r += 1
-#             elif cur_demand[c] == 0: c += 1
-
-#     def calculate_total_cost(self):
-#         return sum(self.allocation[r][c] * self.costs[r][c] for r in range(self.rows) for c in range(self.cols))
-
-#     def fix_degeneracy(self):
-#         count = sum(1 for r in range(self.rows) for c in range(self.cols) if self.allocation[r][c] > 0)
-#         req = self.rows + self.cols - 1
-#         if count < req:
-#             for r in range(self.rows):
-#                 for c in range(self.cols):
-#                     if self.allocation[r][c] == 0:
-#                         self.allocation[r][c] = 1e-10 
-#                         count += 1
-#                         if count == req: return
-
-#     def calculate_uv(self):
-#         u = [None] * self.rows
-#         v = [None] * self.cols
-#         u[0] = 0
-#         changed = True
-#         while changed:
-#             changed = False
-#             for r in range(self.rows):
-#                 for c in range(self.cols):
-#                     if self.allocation[r][c] > 0 or self.allocation[r][c] == 1e-10:
-#                         if u[r] is not None and v[c] is None:
-#                             v[c] = self.costs[r][c] - u[r]
-#                             changed = True
-#                         elif u[r] is None and v[c] is not None:
-#                             u[r] = self.costs[r][c] - v[c]
-#                             changed = True
-#         if None in u or None in v: return None, None
-#         return u, v
-
-#     def get_closed_loop(self, start_node):
-#         def get_neighbors(curr, prev_dir):
-#             neighbors = []
-#             if prev_dir == 'H': 
-#                 c = curr[1]
-#                 for r in range(self.rows):
-#                     if r != curr[0] and (self.allocation[r][c] > 0 or self.allocation[r][c] == 1e-10):
-#                         neighbors.append(((r, c), 'V'))
-#             else: 
-#                 r = curr[0]
-#                 for c in range(self.cols):
-#                     if c != curr[1] and ((r,c) == start_node or self.allocation[r][c] > 0 or self.allocation[r][c] == 1e-10):
-#                         neighbors.append(((r, c), 'H'))
-#             return neighbors
-
-#         stack = [(start_node, [start_node], 'V')]
-#         while stack:
-#             curr, path, p_dir = stack.pop()
-#             for n_node, n_dir in get_neighbors(curr, p_dir):
-#                 if n_node == start_node and len(path) >= 3: return path
-#                 if n_node not in path: stack.append((n_node, path + [n_node], n_dir))
-#         return None
-
-class TransportationSolver:
-    def __init__(self, costs, supply, demand):
+
+class SolverWorker(QObject):
+    """Runs TransportationSolver on a background QThread so the UI stays responsive"""
+    progress = pyqtSignal(str, str)             # (message, style) for each log entry
+    finished = pyqtSignal(object, object, list) # (allocation, min_cost, logs)
+    failed = pyqtSignal(str)
+
+    def __init__(self, costs, supply, demand, alloc=None, teaching=False):
+        super().__init__()
         self.costs = costs
-        self.supply = list(supply)
-        self.demand = list(demand)
-        self.rows = len(costs)
-        self.cols = len(costs[0])
-        self.allocation = [[0 for _ in range(self.cols)] for _ in range(self.rows)]
-        self.logs = [] 
-
-    def log(self, message, style="normal"):
-        self.logs.append((message, style))
-
-    def solve(self):
-        self.log("Initializing Basic Feasible Solution (NWCM)...", "header")
-        self.nwcm()
-        initial_cost = self.calculate_total_cost()
-        self.log(f"Initial BFS Cost: ${initial_cost}", "bold")
-
-        iteration = 1
-        max_iterations = 100 # Safety break to prevent infinite loops
-        
-        while iteration < max_iterations:
-            self.log(f"--- Optimization Iteration {iteration} ---", "header")
-            
-            # 1. Check for Degeneracy
-            self.fix_degeneracy()
-            
-            # 2. Calculate Potentials (u, v)
-            u, v = self.calculate_uv()
-            
-            if u is None: 
-                self.log("Graph disconnected (Degeneracy error). Stopping.", "error")
-                break
-
-            # 3. Calculate Opportunity Costs
-            min_d = 0
-            entering_cell = None
-
-            for r in range(self.rows):
-                for c in range(self.cols):
-                    if self.allocation[r][c] == 0: # Empty cell
-                        # Opportunity Cost = Cost - (u + v)
-                        d_val = self.costs[r][c] - (u[r] + v[c])
-                        if d_val < min_d: # Find most negative
-                            min_d = d_val
-                            entering_cell = (r, c)
-
-            # 4. Optimality Check
-            if min_d >= -1e-9: 
-                self.log("All opportunity costs >= 0. Solution is Optimal!", "success")
-                break
-            
-            self.log(f"Negative opp. cost ({min_d}) at {entering_cell}. Improving...", "highlight")
-
-            # 5. Find Closed Loop
-            path = self.get_closed_loop(entering_cell)
-            if not path:
-                self.log("Error: Closed loop not found. This might be a complex degeneracy issue.", "error")
-                break
-
-            # 6. Adjust Allocation (Shift Theta)
-            # Find the minimum allocation among the (-) cells in the loop
-            # Path structure: Start(+) -> Next(-) -> Next(+) -> Next(-) ...
-            minus_cells_values = []
-            for i in range(1, len(path), 2):
-                r, c = path[i]
-                minus_cells_values.append(self.allocation[r][c])
-            
-            theta = min(minus_cells_values)
-            self.log(f"Shifting {theta} units along the loop.", "normal")
-
-            for i, (r, c) in enumerate(path):
-                if i % 2 == 0: self.allocation[r][c] += theta # Add to (+)
-                else: self.allocation[r][c] -= theta          # Subtract from (-)
-
-            iteration += 1
-
-        return self.allocation, self.calculate_total_cost(), self.logs
-
-    def nwcm(self):
-        """North West Corner Method"""
-        r, c = 0, 0
-        cur_supply, cur_demand = list(self.supply), list(self.demand)
-        while r < self.rows and c < self.cols:
-            qty = min(cur_supply[r], cur_demand[c])
-            self.allocation[r][c] = qty
-            cur_supply[r] -= qty
-            cur_demand[c] -= qty
-            
-            if cur_supply[r] == 0: r += 1
-            elif cur_demand[c] == 0: c += 1
-
-    def calculate_total_cost(self):
-        return sum(self.allocation[r][c] * self.costs[r][c] for r in range(self.rows) for c in range(self.cols))
-
-    def fix_degeneracy(self):
-        """Ensures allocations = m + n - 1 by adding epsilon to valid empty cells"""
-        # Calculate current allocations (ignoring pure zeros, counting epsilons)
-        alloc_count = sum(1 for r in range(self.rows) for c in range(self.cols) if self.allocation[r][c] > 0 or self.allocation[r][c] == 1e-10)
-        required = self.rows + self.cols - 1
-        
-        if alloc_count < required:
-            # Degeneracy detected. Add epsilon (1e-10) to the lowest cost empty cells 
-            # that don't create a loop (simplified logic here: just fill lowest cost empty)
-            needed = required - alloc_count
-            
-            # Create list of empty cells sorted by cost (heuristic to pick 'sensible' dummy paths)
-            empty_cells = []
-            for r in range(self.rows):
-                for c in range(self.cols):
-                    if self.allocation[r][c] == 0:
-                        empty_cells.append((self.costs[r][c], r, c))
-            empty_cells.sort()
-            
-            for i in range(min(needed, len(empty_cells))):
-                _, r, c = empty_cells[i]
-                self.allocation[r][c] = 1e-10 
-                # Note: A robust system would check if adding this epsilon forms a loop, 
-                # but for this scale, sorting by cost is usually sufficient to avoid bad cycles.
-
-    def calculate_uv(self):
-        """Calculates u (row potentials) and v (col potentials)"""
-        u = [None] * self.rows
-        v = [None] * self.cols
-        u[0] = 0 # Arbitrary start
-        
-        # Iteratively update u and v
-        for _ in range(self.rows + self.cols): # Safety loop limit
-            changed = False
-            for r in range(self.rows):
-                for c in range(self.cols):
-                    # Check allocated cells (including epsilon)
-                    if self.allocation[r][c] > 0 or self.allocation[r][c] == 1e-10:
-                        if u[r] is not None and v[c] is None:
-                            v[c] = self.costs[r][c] - u[r]
-                            changed = True
-                        elif u[r] is None and v[c] is not None:
-                            u[r] = self.costs[r][c] - v[c]
-                            changed = True
-            if not changed:
-                break
-                
-        # If potentials are still None, the graph is disconnected
-        if None in u or None in v:
-            return None, None
-        return u, v
-
-    def get_closed_loop(self, start_node):
-        """Finds a stepping stone path: Empty -> Allocated -> Allocated ... -> Empty"""
-        
-        def get_neighbors(curr, prev_direction):
-            neighbors = []
-            if prev_direction == 'H': 
-                # Was Horizontal, must move Vertical (Change Row, Same Col)
-                c = curr[1]
-                for r in range(self.rows):
-                    if r != curr[0]:
-                        if self.allocation[r][c] > 0 or self.allocation[r][c] == 1e-10:
-                            neighbors.append(((r, c), 'V'))
-            else: 
-                # Was Vertical, must move Horizontal (Change Col, Same Row)
-                r = curr[0]
-                for c in range(self.cols):
-                    if c != curr[1]:
-                        # Can land on empty cell ONLY if it is the start node (closing the loop)
-                        if (r, c) == start_node:
-                             neighbors.append(((r, c), 'H'))
-                        elif self.allocation[r][c] > 0 or self.allocation[r][c] == 1e-10:
-                            neighbors.append(((r, c), 'H'))
-            return neighbors
-
-        # DFS State: (Current Node, Current Path, Direction Arrived From)
-        # CRITICAL FIX: We must try starting the loop Horizontally AND Vertically
-        # 'V' in tuple -> Pretend we arrived Vertically, so next move is Horizontal
-        # 'H' in tuple -> Pretend we arrived Horizontally, so next move is Vertical
-        stack = [
-            (start_node, [start_node], 'V'), 
-            (start_node, [start_node], 'H')
-        ] 
-
-        while stack:
-            curr, path, p_dir = stack.pop()
-            
-            # Get valid next moves
-            next_moves = get_neighbors(curr, p_dir)
-            
-            for next_node, move_dir in next_moves:
-                if next_node == start_node and len(path) >= 4: # Loop needs at least 4 nodes
-                    return path 
-                if next_node not in path:
-                    stack.append((next_node, path + [next_node], move_dir))
-        
+        self.supply = supply
+        self.demand = demand
+        self.alloc = alloc
+        self.teaching = teaching
+
+    def run(self):
+        try:
+            solver = TransportationSolver(self.costs, self.supply, self.demand,
+                                          on_log=self.progress.emit, round_cost=True,
+                                          teaching=self.teaching, alloc=self.alloc)
+            allocation, min_cost, logs = solver.solve()
+        except Exception as e:
+            self.failed.emit(str(e))
+        else:
+            self.finished.emit(allocation, min_cost, logs)
+
+class TransportModel(QAbstractTableModel):
+    """Cost grid with a SUPPLY column and a DEMAND row, stored in one int32 NumPy array.
+    Cells are rendered on demand by the view; nothing is allocated per cell.
+    A cost cell set to "-" is a forbidden route, tracked in a boolean mask beside the grid."""
+    invalid_input = pyqtSignal(str) # Explains an edit that setData rejected
+
+    # Shared by every cell (and every model) instead of built per data() call
+    _SUPPLY_BRUSH = QBrush(QColor(0, 255, 0, 30))
+    _DEMAND_BRUSH = QBrush(QColor(255, 0, 0, 30))
+    _CORNER_BRUSH = QBrush(Qt.GlobalColor.lightGray)
+    _FORBIDDEN_BRUSH = QBrush(QColor(128, 128, 128, 60))
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._allocate(0, 0)
+
+    def reset(self, rows, cols):
+        """Replaces the grid with a zeroed rows x cols problem and default header labels.
+        Shrinking (or keeping the size) removes the surplus rows/columns in place, so the
+        view keeps its sections; only growing needs a full model reset."""
+        if rows > self.rows or cols > self.cols:
+            self.beginResetModel()
+            self._allocate(rows, cols)
+            self.endResetModel()
+            return
+
+        if (rows, cols) == (self.rows, self.cols):
+            self._allocate(rows, cols) # Same size: just a fresh zeroed grid
+        # Interior rows/columns go; the DEMAND row and SUPPLY column stay last
+        if rows < self.rows:
+            self.beginRemoveRows(QModelIndex(), rows, self.rows - 1)
+            self._allocate(rows, self.cols)
+            self.endRemoveRows()
+        if cols < self.cols:
+            self.beginRemoveColumns(QModelIndex(), cols, self.cols - 1)
+            self._allocate(rows, cols)
+            self.endRemoveColumns()
+
+        # Surviving cells and headers: refresh with one signal each
+        self.dataChanged.emit(self.index(0, 0), self.index(rows, cols))
+        self.headerDataChanged.emit(Qt.Orientation.Horizontal, 0, cols)
+        self.headerDataChanged.emit(Qt.Orientation.Vertical, 0, rows)
+
+    def _allocate(self, rows, cols):
+        self.rows, self.cols = rows, cols
+        self.grid = np.zeros((rows + 1, cols + 1), np.int32)
+        # Views into grid: writing through them updates the table
+        self.costs = self.grid[:rows, :cols]
+        self.supply = self.grid[:rows, cols]
+        self.demand = self.grid[rows, :cols]
+        self.forbidden = np.zeros((rows, cols), bool)
+        self.h_labels = [f"Dest {i+1}" for i in range(cols)] + ["SUPPLY"]
+        self.v_labels = [f"Warehouse {i+1}" for i in range(rows)] + ["DEMAND"]
+
+    def load(self, costs, supply, demand):
+        """Writes a whole problem into the grid and refreshes it with one dataChanged"""
+        self.costs[:] = costs
+        self.forbidden[:] = False
+        self.supply[:] = supply
+        self.demand[:] = demand
+        self.dataChanged.emit(self.index(0, 0), self.index(self.rows, self.cols))
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.rows + 1
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.cols + 1
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        r, c = index.row(), index.column()
+        is_corner = (r == self.rows and c == self.cols)
+        is_forbidden = (r < self.rows and c < self.cols and self.forbidden[r, c])
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            if is_corner: return ""
+            return "-" if is_forbidden else str(self.grid[r, c])
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            return Qt.AlignmentFlag.AlignCenter
+        if role == Qt.ItemDataRole.BackgroundRole:
+            if is_corner: return self._CORNER_BRUSH
+            if c == self.cols: return self._SUPPLY_BRUSH
+            if r == self.rows: return self._DEMAND_BRUSH
+            if is_forbidden: return self._FORBIDDEN_BRUSH
+        if role == Qt.ItemDataRole.ToolTipRole:
+            if is_corner: return None
+            if is_forbidden: return "Forbidden route: nothing is shipped here"
+            if c == self.cols or r == self.rows: return self.cell_name(r, c)
         return None
 
-# ==========================================
-#  RESIZABLE GUI
-# ==========================================
+    def cell_name(self, r, c):
+        """How messages and tooltips refer to grid cell (r, c)"""
+        if c == self.cols: return f"Supply at Warehouse {r+1}"
+        if r == self.rows: return f"Demand at Dest {c+1}"
+        return f"Cost at Row {r+1}, Col {c+1}"
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if role != Qt.ItemDataRole.EditRole:
+            return False
+        r, c = index.row(), index.column()
+        is_cost = (r < self.rows and c < self.cols)
+        if is_cost and str(value).strip() == "-":
+            self.grid[r, c] = 0
+            self.forbidden[r, c] = True
+            self.dataChanged.emit(index, index)
+            return True
+
+        # Rejected edits keep the old value and say why instead of reverting silently
+        try:
+            self.grid[r, c] = int(value)
+        except ValueError:
+            hint = " (or - for a forbidden route)" if is_cost else ""
+            self.invalid_input.emit(f"Invalid {self.cell_name(r, c)}: '{value}' is not a whole number{hint}.")
+            return False
+        except OverflowError:
+            self.invalid_input.emit(f"Invalid {self.cell_name(r, c)}: {value} is out of range.")
+            return False
+        if is_cost:
+            self.forbidden[r, c] = False
+        self.dataChanged.emit(index, index)
+        return True
+
+    def flags(self, index):
+        if index.row() == self.rows and index.column() == self.cols:
+            return Qt.ItemFlag.NoItemFlags
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEditable
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        labels = self.h_labels if orientation == Qt.Orientation.Horizontal else self.v_labels
+        return labels[section] if section < len(labels) else None
+
+    def setHeaderData(self, section, orientation, value, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return False
+        labels = self.h_labels if orientation == Qt.Orientation.Horizontal else self.v_labels
+        labels[section] = value
+        self.headerDataChanged.emit(orientation, section, section)
+        return True
+
+    def set_header_labels(self, orientation, labels):
+        """Replaces every label of one orientation; one headerDataChanged, and only if any differ"""
+        if orientation == Qt.Orientation.Horizontal:
+            if labels == self.h_labels: return
+            self.h_labels = labels
+        else:
+            if labels == self.v_labels: return
+            self.v_labels = labels
+        self.headerDataChanged.emit(orientation, 0, len(labels) - 1)
 
 class NativeTransportApp(QMainWindow):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Optimal Delivery Allocation System")
         self.resize(1000, 900)
+        self._solver_thread = None
+        self._solver_worker = None
+        self._rng = np.random.default_rng() # Source for "Random Balanced Data"
+
+        # Coalesces the per-pixel sectionResized storm of a drag into one header pass
+        self._header_timer = QTimer(self)
+        self._header_timer.setSingleShot(True)
+        self._header_timer.timeout.connect(self.force_header_update)
+
         self.setup_ui()
 
     def setup_ui(self):
@@ -364,11 +217,11 @@ class NativeTransportApp(QMainWindow):
         font.setBold(True)
         title.setFont(font)
         
-        subtitle = QLabel("Algorithm: North West Corner Method + MODI Optimization")
-        subtitle.setStyleSheet("color: gray;")
+        self.subtitle = QLabel()
+        self.subtitle.setStyleSheet("color: gray;")
         
         main_layout.addWidget(title)
-        main_layout.addWidget(subtitle)
+        main_layout.addWidget(self.subtitle)
 
         # --- 2. Configuration (Fixed) ---
         config_group = QGroupBox("Configuration")
@@ -408,15 +261,21 @@ class NativeTransportApp(QMainWindow):
         self.splitter = QSplitter(Qt.Orientation.Vertical)
         
         # --- Section A: The Table (Top) ---
-        self.table = QTableWidget()
+        self.model = TransportModel(self)
+        self.model.invalid_input.connect(self._input_rejected)
+        self.table = QTableView()
+        self.table.setModel(self.model)
         self.table.setAlternatingRowColors(True)
         self.table.verticalHeader().setVisible(True)
         self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        # The headers outlive every grid rebuild, so these are connected exactly once
+        self.table.horizontalHeader().sectionResized.connect(self._schedule_header_update)
+        self.table.verticalHeader().sectionResized.connect(self._schedule_header_update)
         self.splitter.addWidget(self.table)
 
         # --- Section B: The Button (Fixed Height Middle) ---
         self.btn_container = QWidget()
-        btn_layout = QVBoxLayout(self.btn_container)
+        btn_layout = QHBoxLayout(self.btn_container)
         
         btn_layout.setContentsMargins(0, 5, 0, 5) 
         btn_layout.setSpacing(0)
@@ -432,6 +291,24 @@ class NativeTransportApp(QMainWindow):
         self.btn_solve.clicked.connect(self.run_solver)
         
         btn_layout.addWidget(self.btn_solve)
+
+        # Teaching mode: step through NWCM + MODI instead of the one-shot HiGHS solve
+        self.chk_teaching = QCheckBox("Show MODI Steps")
+        self.chk_teaching.setToolTip("Solve step by step (NWCM + MODI) and log every iteration")
+        self.chk_teaching.toggled.connect(self.update_subtitle)
+        if not HAVE_HIGHS:
+            # No SciPy: MODI is the only solver, so the choice is fixed
+            self.chk_teaching.setChecked(True)
+            self.chk_teaching.setEnabled(False)
+        btn_layout.addWidget(self.chk_teaching)
+        self.update_subtitle()
+
+        # Busy indicator shown next to the (disabled) button while the solver thread runs
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setRange(0, 0)
+        self.progress_bar.setFixedSize(200, 40)
+        self.progress_bar.setVisible(False)
+        btn_layout.addWidget(self.progress_bar)
         self.btn_container.setFixedHeight(50)
         
         self.splitter.addWidget(self.btn_container)
@@ -453,204 +330,202 @@ class NativeTransportApp(QMainWindow):
         # Initialize
         self.generate_grid()
 
+    def update_subtitle(self):
+        """Names the algorithm that the next solve will use"""
+        if self.chk_teaching.isChecked():
+            self.subtitle.setText("Algorithm: North West Corner Method + MODI Optimization")
+        else:
+            self.subtitle.setText("Algorithm: Linear Programming (SciPy HiGHS)")
+
     def generate_grid(self):
         rows = self.spin_rows.value()
         cols = self.spin_cols.value()
+        # Every cell starts as 0 (corner blank), so nothing else to fill
         self._build_table_structure(rows, cols)
-        
-        for r in range(rows + 1):
-            for c in range(cols + 1):
-                if not self.table.item(r, c) or self.table.item(r,c).text() == "":
-                     self._set_cell(r, c, "0")
-        self._set_cell(rows,cols,"")
 
     def generate_random_data(self):
         rows = self.spin_rows.value()
         cols = self.spin_cols.value()
         self._build_table_structure(rows, cols)
+        self._fill_random_data(rows, cols)
 
+    def _fill_random_data(self, rows, cols):
+        rng = self._rng
         # Fill Costs
-        for r in range(rows):
-            for c in range(cols):
-                self._set_cell(r, c, str(random.randint(10, 100)))
+        costs = rng.integers(10, 101, (rows, cols))
 
         # Fill Supply & Demand
-        supplies = [random.randint(20, 100) for _ in range(rows)]
-        demands = [random.randint(20, 100) for _ in range(cols)]
+        supplies = rng.integers(20, 101, rows)
+        demands = rng.integers(20, 101, cols)
 
         # Balance
-        diff = sum(supplies) - sum(demands)
+        diff = supplies.sum() - demands.sum()
         if diff > 0:
-            demands[random.randint(0, cols - 1)] += diff
+            demands[rng.integers(cols)] += diff
         elif diff < 0:
-            supplies[random.randint(0, rows - 1)] += abs(diff)
+            supplies[rng.integers(rows)] -= diff
 
-        for r in range(rows):
-            self._set_cell(r, cols, str(supplies[r]))
-        for c in range(cols):
-            self._set_cell(rows, c, str(demands[c]))
+        self.model.load(costs, supplies, demands)
 
     def _build_table_structure(self, rows, cols):
         """Helper to setup headers and row/col counts"""
-        self.table.setRowCount(rows + 1)
-        self.table.setColumnCount(cols + 1)
-
-        # 1. Set Default Headers (Will be updated dynamically)
-        h_labels = [f"Dest {i+1}" for i in range(cols)] + ["SUPPLY"]
-        v_labels = [f"Warehouse {i+1}" for i in range(rows)] + ["DEMAND"]
-        
-        self.table.setHorizontalHeaderLabels(h_labels)
-        self.table.setVerticalHeaderLabels(v_labels)
-        
-        # 2. Re-Connect Signals 
-        try:
-            self.table.horizontalHeader().sectionResized.disconnect()
-            self.table.verticalHeader().sectionResized.disconnect()
-        except:
-            pass
-
-        self.table.horizontalHeader().sectionResized.connect(self.update_h_headers)
-        self.table.verticalHeader().sectionResized.connect(self.update_v_headers)
-
-        # 3. Setup Cells
-        for r in range(rows + 1):
-            for c in range(cols + 1):
-                item = QTableWidgetItem("0")
-                item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-
-                if r == rows and c < cols:
-                    item.setBackground(QColor(255, 0, 0, 30))
-                    item.setToolTip(f"Demand at Dest {c+1}")
-                elif r < rows and c == cols:
-                    item.setBackground(QColor(0, 255, 0, 30))
-                    item.setToolTip(f"Supply at Warehouse {r+1}")
-                elif r == rows and c == cols:
-                    item = QTableWidgetItem("")
-                    item.setFlags(Qt.ItemFlag.NoItemFlags)
-                    item.setBackground(Qt.GlobalColor.lightGray)
-                
-                self.table.setItem(r, c, item)
-        
-        # 4. FORCE UPDATE: Use QTimer to wait for the layout to apply Stretch, then check text
+        # 1. Fresh zeroed grid with default headers (will be updated dynamically);
+        # the model reshapes its array, there are no per-cell items to build
+        self.model.reset(rows, cols)
+
+        # Solve buffers sized to the grid, overwritten in place by every solve. float64 is
+        # the solver's working dtype, so it reads them as they are instead of converting
+        self._costs = np.zeros((rows, cols))
+        self._supply = np.zeros(rows)
+        self._demand = np.zeros(cols)
+        self._alloc = np.zeros((rows, cols))
+
+        # 2. FORCE UPDATE: Use QTimer to wait for the layout to apply Stretch, then check text
         QTimer.singleShot(0, self.force_header_update)
 
+    def _input_rejected(self, message):
+        QMessageBox.critical(self, "Input Error", message)
+
+    def _schedule_header_update(self, logicalIndex, oldSize, newSize):
+        """sectionResized slot: (re)starts the debounce timer instead of relabelling now"""
+        self._header_timer.start(16)
+
     def force_header_update(self):
         """Manually runs the update logic for all headers to catch initial compressed states"""
-        cols = self.table.columnCount()
-        rows = self.table.rowCount()
-        
-        for c in range(cols):
-            self.update_h_headers(c, 0, self.table.columnWidth(c))
-            
-        for r in range(rows):
-            self.update_v_headers(r, 0, self.table.rowHeight(r))
+        n_dest, n_wh = self.model.cols, self.model.rows
+        col_width, row_height = self.table.columnWidth, self.table.rowHeight
+        h_label, v_label = self._h_label, self._v_label
+
+        # Whole label lists in one call per orientation instead of one setHeaderData per section
+        self.model.set_header_labels(Qt.Orientation.Horizontal,
+                                     [h_label(c, col_width(c), c == n_dest) for c in range(n_dest + 1)])
+        self.model.set_header_labels(Qt.Orientation.Vertical,
+                                     [v_label(r, row_height(r), r == n_wh) for r in range(n_wh + 1)])
 
     # --- DYNAMIC HEADER LOGIC ---
-    def update_h_headers(self, logicalIndex, oldSize, newSize):
+    @staticmethod
+    def _h_label(idx, width, is_supply=False):
         """Switches between 'Dest X' and 'DX' based on column width"""
-        is_supply = (logicalIndex == self.table.columnCount() - 1)
-        
         if is_supply:
-            text = "SUPPLY" if newSize > 70 else "SUP"
-        else:
-            if newSize < 65:
-                text = f"D{logicalIndex + 1}"
-            else:
-                text = f"Dest {logicalIndex + 1}"
-
-        item = self.table.horizontalHeaderItem(logicalIndex)
-        if item and item.text() != text:
-            item.setText(text)
+            return "SUPPLY" if width > 70 else "SUP"
+        return f"D{idx + 1}" if width < 65 else f"Dest {idx + 1}"
 
-    def update_v_headers(self, logicalIndex, oldSize, newSize):
+    @staticmethod
+    def _v_label(idx, height, is_demand=False):
         """Switches between 'Warehouse X' and 'WX' based on row height"""
-        is_demand = (logicalIndex == self.table.rowCount() - 1)
-        
         if is_demand:
-            text = "DEMAND" if newSize > 70 else "DEM"
-        else:
-            if newSize < 100:
-                text = f"W{logicalIndex + 1}"
-            else:
-                text = f"Warehouse {logicalIndex + 1}"
-
-        item = self.table.verticalHeaderItem(logicalIndex)
-        if item and item.text() != text:
-            item.setText(text)
-
-    def _set_cell(self, r, c, value):
-        item = self.table.item(r, c)
-        if item:
-            item.setText(value)
+            return "DEMAND" if height > 70 else "DEM"
+        return f"W{idx + 1}" if height < 100 else f"Warehouse {idx + 1}"
 
     def run_solver(self):
         try:
-            rows = self.spin_rows.value()
-            cols = self.spin_cols.value()
-            
-            costs = []
-            supply = []
-            demand = []
-
-            for r in range(rows):
-                row_costs = []
-                for c in range(cols):
-                    text = self.table.item(r, c).text()
-                    if not text.isdigit():
-                        raise ValueError(f"Invalid cost at Row {r+1}, Col {c+1}")
-                    row_costs.append(int(text))
-                costs.append(row_costs)
-                
-                s_text = self.table.item(r, cols).text()
-                if (int(s_text) <0):
-                    return QMessageBox.warning(self, "Unbalanced Problem", f"Invalid Supply at Warehouse {r+1}")
-                supply.append(int(s_text) if s_text else 0)
-
-            for c in range(cols):
-                d_text = self.table.item(rows, c).text()
-                if (int(d_text) < 0):
-                    return QMessageBox.warning(self, "Unbalanced Problem", f"Invalid Demand at Destination {c+1}")
-                demand.append(int(d_text) if d_text else 0)
-
-            if sum(supply) != sum(demand):
+            # The model already holds parsed int32 values; the solver gets a snapshot
+            # in the reused buffers so the grid stays editable while it runs
+            costs, supply, demand = self._costs, self._supply, self._demand
+            np.copyto(costs, self.model.costs)
+            np.copyto(supply, self.model.supply)
+            np.copyto(demand, self.model.demand)
+            costs[self.model.forbidden] = np.inf # The solver fixes these routes at 0
+
+            bad = np.argwhere(costs < 0)
+            if len(bad):
+                r, c = bad[0]
+                raise ValueError(f"Invalid cost at Row {r+1}, Col {c+1}: costs must not be negative.")
+
+            bad = np.flatnonzero(supply < 0)
+            if len(bad):
+                return QMessageBox.warning(self, "Unbalanced Problem", f"Invalid Supply at Warehouse {bad[0]+1}")
+            bad = np.flatnonzero(demand < 0)
+            if len(bad):
+                return QMessageBox.warning(self, "Unbalanced Problem", f"Invalid Demand at Destination {bad[0]+1}")
+
+            total_s, total_d = int(supply.sum()), int(demand.sum())
+            if total_s != total_d:
                 QMessageBox.warning(self, "Unbalanced Problem", 
-                                    f"Total Supply ({sum(supply)}) must equal Total Demand ({sum(demand)}).")
+                                    f"Total Supply ({total_s}) must equal Total Demand ({total_d}).")
                 return
 
-            solver = TransportationSolver(costs, supply, demand)
-            allocation, min_cost, logs = solver.solve()
-
-            html = "<h3>Optimization Process Logs:</h3>"
-            for msg, style in logs:
-                if style == "header": html += f"<b>{msg}</b><br>"
-                elif style == "success": html += f"<span style='color:green'><b>{msg}</b></span><br>"
-                elif style == "error": html += f"<span style='color:red'><b>{msg}</b></span><br>"
-                elif style == "highlight": html += f"<span style='color:orange'><b>{msg}</b></span><br>"
-                else: html += f"{msg}<br>"
-            
-            html += "<hr>"
-            html += f"<h2>MINIMUM TOTAL COST: Rs. {min_cost}</h2>"
-            html += "<table border='1' cellspacing='0' cellpadding='5' width='100%'>"
-            html += "<tr style='background-color:#eee'><th>From</th><th>To</th><th>Quantity</th><th>Unit Cost</th><th>Subtotal</th></tr>"
-            
-            for r in range(rows):
-                for c in range(cols):
-                    qty = allocation[r][c]
-                    if qty > 0:
-                        unit_c = costs[r][c]
-                        sub = qty * unit_c
-                        # OUTPUT TABLE: Also uses W/D format to match grid
-                        html += f"<tr><td>W{r+1}</td><td>D{c+1}</td>"
-                        html += f"<td><b>{int(qty)}</b></td><td>Rs. {unit_c}</td><td>Rs. {sub}</td></tr>"
-            html += "</table>"
-
-            self.txt_output.setHtml(html)
+            self._start_solver(costs, supply, demand)
 
-        except ValueError:
-            QMessageBox.critical(self, "Input Error", "Please ensure all grid cells contain Positive Values.")
+        except ValueError as e:
+            QMessageBox.critical(self, "Input Error", str(e))
         except Exception as e:
             QMessageBox.critical(self, "Error", str(e))
 
+    # --- BACKGROUND SOLVE ---
+    def _start_solver(self, costs, supply, demand):
+        """Runs the solver on a worker thread; logs stream into the output as they arrive"""
+        self.btn_solve.setEnabled(False)
+        self.progress_bar.setVisible(True)
+        self.txt_output.setHtml("<h3>Optimization Process Logs:</h3>")
+
+        self._solver_thread = QThread(self)
+        self._solver_worker = SolverWorker(costs, supply, demand, self._alloc, self.chk_teaching.isChecked())
+        self._solver_worker.moveToThread(self._solver_thread)
+
+        self._solver_thread.started.connect(self._solver_worker.run)
+        self._solver_worker.progress.connect(self._append_log)
+        self._solver_worker.finished.connect(self._render_result)
+        self._solver_worker.failed.connect(self._solver_failed)
+        self._solver_worker.finished.connect(self._solver_thread.quit)
+        self._solver_worker.failed.connect(self._solver_thread.quit)
+        self._solver_thread.finished.connect(self._solver_done)
+
+        self._solver_thread.start()
+
+    @staticmethod
+    def _format_log(msg, style):
+        if style == "header": return f"<b>{msg}</b>"
+        elif style == "success": return f"<span style='color:green'><b>{msg}</b></span>"
+        elif style == "error": return f"<span style='color:red'><b>{msg}</b></span>"
+        elif style == "highlight": return f"<span style='color:orange'><b>{msg}</b></span>"
+        else: return msg
+
+    def _append_log(self, msg, style):
+        self.txt_output.append(self._format_log(msg, style))
+
+    def _render_result(self, allocation, min_cost, logs):
+        """Appends the cost and allocation table below the already streamed logs"""
+        costs = self._solver_worker.costs
+
+        parts = [
+            "<hr>",
+            f"<h2>MINIMUM TOTAL COST: Rs. {min_cost}</h2>",
+            "<table border='1' cellspacing='0' cellpadding='5' width='100%'>",
+            "<tr style='background-color:#eee'><th>From</th><th>To</th><th>Quantity</th><th>Unit Cost</th><th>Subtotal</th></tr>",
+        ]
+        # OUTPUT TABLE: Also uses W/D format to match grid (only cells that ship something)
+        rs, cs = np.nonzero(allocation)
+        qtys, unit_costs = allocation[rs, cs], costs[rs, cs]
+        subtotals = qtys * unit_costs # All subtotals in one vectorised product
+        append = parts.append
+        for r, c, qty, unit_c, sub in zip(rs.tolist(), cs.tolist(), qtys.tolist(), unit_costs.tolist(), subtotals.tolist()):
+            append(f"<tr><td>W{r+1}</td><td>D{c+1}</td>"
+                   f"<td><b>{int(qty)}</b></td><td>Rs. {unit_c:.0f}</td><td>Rs. {sub:.0f}</td></tr>")
+        parts.append("</table>")
+
+        # One insert at the end of the document instead of re-parsing everything with setHtml
+        cursor = self.txt_output.textCursor()
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        cursor.insertHtml("".join(parts))
+
+    def _solver_failed(self, message):
+        QMessageBox.critical(self, "Error", message)
+
+    def _solver_done(self):
+        self.progress_bar.setVisible(False)
+        self.btn_solve.setEnabled(True)
+        self._solver_worker.deleteLater()
+        self._solver_thread.deleteLater()
+        self._solver_worker = self._solver_thread = None
+
+    def closeEvent(self, event):
+        # Let a running solve finish instead of destroying its thread mid-run
+        if self._solver_thread is not None:
+            self._solver_thread.quit()
+            self._solver_thread.wait()
+        super().closeEvent(event)
+
 if __name__ == "__main__":
     app = QApplication(sys.argv)
     window = NativeTransportApp()
@@ -0,0 +1,442 @@
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    # Numba is optional: without it the solver kernels run as plain Python
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+try:
+    from scipy.optimize import linprog
+    from scipy.sparse import csc_matrix
+    from scipy.sparse.csgraph import connected_components
+except ImportError:
+    # SciPy is optional: without it solve() always takes the MODI path
+    linprog = connected_components = None
+
+HAVE_HIGHS = linprog is not None # False without SciPy: every solve steps through MODI
+
+# ==========================================
+#  BACKEND LOGIC
+# ==========================================
+
+# --- Compiled kernels (Numba) ---
+# The numeric inner loops of the solver, kept free of Python objects so they
+# compile in nopython mode. TransportationSolver drives them and does the logging.
+
+@njit(cache=True, nogil=True)
+def _basic_csr(is_basic):
+    """Basic cells as bipartite adjacency in CSR form: (row_ptr, row_adj, col_ptr, col_adj)"""
+    rows, cols = is_basic.shape
+    row_ptr = np.zeros(rows + 1, np.int64)
+    col_ptr = np.zeros(cols + 1, np.int64)
+    for r in range(rows):
+        for c in range(cols):
+            if is_basic[r, c]:
+                row_ptr[r + 1] += 1
+                col_ptr[c + 1] += 1
+    row_ptr = np.cumsum(row_ptr)
+    col_ptr = np.cumsum(col_ptr)
+
+    # Row-major fill: columns within a row and rows within a column come out sorted
+    row_adj = np.empty(row_ptr[rows], np.int64)
+    col_adj = np.empty(row_ptr[rows], np.int64)
+    col_fill = col_ptr[:-1].copy()
+    k = 0
+    for r in range(rows):
+        for c in range(cols):
+            if is_basic[r, c]:
+                row_adj[k] = c
+                k += 1
+                col_adj[col_fill[c]] = r
+                col_fill[c] += 1
+    return row_ptr, row_adj, col_ptr, col_adj
+
+@njit(cache=True, nogil=True)
+def _propagate_potentials(costs, row_ptr, row_adj, col_ptr, col_adj, u, v):
+    """Fills u and v (NaN = unknown) by a BFS over the basic cells. Returns False if disconnected"""
+    rows, cols = u.shape[0], v.shape[0]
+
+    # BFS from row 0. Queue entries < rows are rows, the rest are (rows + column)
+    queue = np.empty(rows + cols, np.int64)
+    queue[0] = 0
+    head, tail = 0, 1
+    while head < tail:
+        node = queue[head]
+        head += 1
+        if node < rows:
+            r = node
+            for k in range(row_ptr[r], row_ptr[r + 1]):
+                c = row_adj[k]
+                if np.isnan(v[c]):
+                    v[c] = costs[r, c] - u[r]
+                    queue[tail] = rows + c
+                    tail += 1
+        else:
+            c = node - rows
+            for k in range(col_ptr[c], col_ptr[c + 1]):
+                r = col_adj[k]
+                if np.isnan(u[r]):
+                    u[r] = costs[r, c] - v[c]
+                    queue[tail] = r
+                    tail += 1
+
+    # Every row and column is resolved exactly once when the graph is connected
+    return tail == rows + cols
+
+@njit(cache=True, nogil=True)
+def _find_closed_loop(start_r, start_c, row_ptr, row_adj, col_ptr, col_adj, rows, cols):
+    """Iterative DFS for a stepping stone loop through the basic cells, starting and
+    ending at the (empty) start cell. Returns the loop as (path_r, path_c), empty if none."""
+    # A loop visits each cell at most once: at most rows + cols - 1 basic cells plus the start
+    max_len = rows + cols + 1
+    path_r = np.empty(max_len, np.int64)
+    path_c = np.empty(max_len, np.int64)
+    cursor = np.empty(max_len, np.int64) # Next adjacency position to try at each depth
+    on_path = np.zeros((rows, cols), np.bool_)
+
+    # Moves alternate, starting vertically from the start cell: the node at depth d moves
+    # vertically when d is even. A spanning-tree basis has exactly one cycle through the
+    # entering cell, so this single search finds it whenever the basis is a tree
+    depth = 0
+    path_r[0], path_c[0] = start_r, start_c
+    on_path[start_r, start_c] = True
+    cursor[0] = col_ptr[start_c]
+
+    while depth >= 0:
+        r, c = path_r[depth], path_c[depth]
+        k = cursor[depth]
+        next_r, next_c = -1, -1
+        if depth % 2 == 0:
+            # Move Vertical (Change Row, Same Col) onto a basic cell
+            end = col_ptr[c + 1]
+            while k < end:
+                nr = col_adj[k]
+                k += 1
+                if nr != r and not on_path[nr, c]:
+                    next_r, next_c = nr, c
+                    break
+        else:
+            # Move Horizontal (Change Col, Same Row). Slot row_ptr[r] - 1 is the closing
+            # move: landing on the empty start cell, once the loop has at least 4 nodes
+            end = row_ptr[r + 1]
+            while k < end:
+                if k == row_ptr[r] - 1:
+                    k += 1
+                    if r == start_r and depth >= 3:
+                        return path_r[:depth + 1].copy(), path_c[:depth + 1].copy()
+                    continue
+                nc = row_adj[k]
+                k += 1
+                if nc != c and not on_path[r, nc]:
+                    next_r, next_c = r, nc
+                    break
+        cursor[depth] = k
+
+        if next_r >= 0:
+            # Descend
+            depth += 1
+            path_r[depth], path_c[depth] = next_r, next_c
+            on_path[next_r, next_c] = True
+            cursor[depth] = col_ptr[next_c] if depth % 2 == 0 else row_ptr[next_r] - 1
+        else:
+            # Every move from this node is exhausted: backtrack
+            on_path[r, c] = False
+            depth -= 1
+
+    return path_r[:0].copy(), path_c[:0].copy()
+
+@njit(cache=True, nogil=True)
+def _most_negative_cell(costs, row_min_cost, u, v, is_basic, forbidden):
+    """Scans non-basic, non-forbidden cells for the most negative opportunity cost Cost - (u + v).
+    Returns (min_d, r, c); min_d is 0 and (r, c) = (-1, -1) when nothing is negative."""
+    rows, cols = costs.shape
+    v_max = v.max()
+    best, best_r, best_c = 0.0, -1, -1
+    for r in range(rows):
+        # No cell of row r can beat this bound, so skip the row once best is below it
+        if row_min_cost[r] - u[r] - v_max >= best:
+            continue
+        for c in range(cols):
+            if not is_basic[r, c] and not forbidden[r, c]:
+                d_val = costs[r, c] - u[r] - v[c]
+                if d_val < best: # Find most negative (first one wins ties)
+                    best, best_r, best_c = d_val, r, c
+    return best, best_r, best_c
+
+# Outcome of one _modi_pivot call
+_PIVOTED, _OPTIMAL, _DISCONNECTED, _NO_LOOP = 0, 1, 2, 3
+
+@njit(cache=True, nogil=True)
+def _modi_pivot(costs, row_min_cost, allocation, is_basic, forbidden):
+    """One MODI iteration on the current basis (allocation and is_basic updated in place).
+    Returns (status, min_d, r, c, theta) for the entering cell (r, c)."""
+    rows, cols = costs.shape
+    row_ptr, row_adj, col_ptr, col_adj = _basic_csr(is_basic)
+
+    # Potentials (u, v)
+    u = np.full(rows, np.nan)
+    v = np.full(cols, np.nan)
+    u[0] = 0.0 # Arbitrary start
+    if not _propagate_potentials(costs, row_ptr, row_adj, col_ptr, col_adj, u, v):
+        return _DISCONNECTED, 0.0, -1, -1, 0.0
+
+    # Opportunity costs and optimality check
+    min_d, r, c = _most_negative_cell(costs, row_min_cost, u, v, is_basic, forbidden)
+    if min_d >= -1e-9:
+        return _OPTIMAL, min_d, r, c, 0.0
+
+    # Closed loop. Path structure: Start(+) -> Next(-) -> Next(+) -> Next(-) ...
+    path_r, path_c = _find_closed_loop(r, c, row_ptr, row_adj, col_ptr, col_adj, rows, cols)
+    n = path_r.shape[0]
+    if n == 0:
+        return _NO_LOOP, min_d, r, c, 0.0
+
+    # Theta = minimum allocation among the (-) cells; the first one attaining it leaves
+    leave = 1
+    for k in range(3, n, 2):
+        if allocation[path_r[k], path_c[k]] < allocation[path_r[leave], path_c[leave]]:
+            leave = k
+    theta = allocation[path_r[leave], path_c[leave]]
+
+    for k in range(n):
+        if k % 2 == 0: allocation[path_r[k], path_c[k]] += theta # Add to (+)
+        else: allocation[path_r[k], path_c[k]] -= theta          # Subtract from (-)
+
+    # The entering cell joins the basis and exactly one (-) cell that hit zero
+    # leaves it, even on ties, so the basis (and basic_count) keeps m + n - 1 cells
+    is_basic[r, c] = True
+    is_basic[path_r[leave], path_c[leave]] = False
+    return _PIVOTED, min_d, r, c, theta
+
+class TransportationSolver:
+    def __init__(self, costs, supply, demand, on_log=None, round_cost=False, teaching=False, alloc=None):
+        self.costs = np.asarray(costs, dtype=np.float64)
+        self.supply = np.asarray(supply, dtype=np.float64)
+        self.demand = np.asarray(demand, dtype=np.float64)
+        self.rows, self.cols = self.costs.shape
+        # Forbidden routes (non-finite costs) are variables fixed at 0. Their cost becomes a
+        # big M that outweighs any loop of real costs, so NWCM flow placed there is pivoted
+        # out again; any flow left on them at the end means there is no feasible allocation
+        self.forbidden = ~np.isfinite(self.costs)
+        if self.forbidden.any():
+            big_m = (self.rows + self.cols) * np.abs(self.costs[~self.forbidden]).max(initial=0.0) + 1.0
+            self.costs = np.where(self.forbidden, big_m, self.costs)
+        if alloc is None:
+            self.allocation = np.zeros_like(self.costs)
+        else:
+            # Caller-owned float64 buffer, reused across solves; the result is written into it
+            if alloc.shape != self.costs.shape or alloc.dtype != np.float64:
+                raise ValueError(f"alloc must be a float64 array of shape {self.costs.shape}")
+            alloc.fill(0)
+            self.allocation = alloc
+        # Basic (allocated) cells, kept alongside allocation; a basic cell may hold 0
+        self.is_basic = np.zeros(self.costs.shape, dtype=bool)
+        self.basic_count = 0 # Number of True cells in is_basic, maintained incrementally
+        self.logs = [] 
+        self.on_log = on_log # Optional callback(message, style) to stream logs as they happen
+        self.round_cost = round_cost # Report the final cost rounded to a whole number
+        self.teaching = teaching # Step through NWCM + MODI with full logs instead of HiGHS
+
+    def log(self, message, style="normal"):
+        self.logs.append((message, style))
+        if self.on_log:
+            self.on_log(message, style)
+
+    def solve(self):
+        parts = self._independent_parts()
+        if parts is not None:
+            result = self._solve_parts(parts)
+        elif self.teaching or linprog is None:
+            result = self.solve_modi()
+        else:
+            result = self.solve_highs()
+
+        if (self.allocation[self.forbidden] > 1e-9).any():
+            raise ValueError("No feasible allocation: some goods can only be shipped over forbidden routes.")
+        return result
+
+    def _independent_parts(self):
+        """(warehouse indices, destination indices) of each sub-problem when non-finite
+        costs (forbidden routes) cut the tableau into disjoint pieces, else None"""
+        if connected_components is None:
+            return None
+        finite = ~self.forbidden
+        if finite.all():
+            return None
+
+        # Bipartite route graph: node r is warehouse r, node rows + c is destination c
+        r, c = np.nonzero(finite)
+        n = self.rows + self.cols
+        graph = csc_matrix((np.ones(len(r)), (r, self.rows + c)), shape=(n, n))
+        n_parts, labels = connected_components(graph, directed=False)
+        if n_parts == 1:
+            return None
+        return [(np.flatnonzero(labels[:self.rows] == k), np.flatnonzero(labels[self.rows:] == k))
+                for k in range(n_parts)]
+
+    def _solve_parts(self, parts):
+        """Solves each independent sub-problem on its own and stitches the allocations"""
+        self.log(f"Forbidden routes split the problem into {len(parts)} independent parts.", "header")
+        # Every part must balance on its own, otherwise there is no solution at all
+        for k, (rs, cs) in enumerate(parts, 1):
+            sub_supply, sub_demand = self.supply[rs].sum(), self.demand[cs].sum()
+            if not np.isclose(sub_supply, sub_demand):
+                raise ValueError(f"No feasible allocation: part {k} of the route network is unbalanced "
+                                 f"(Supply {sub_supply:g} vs Demand {sub_demand:g}).")
+
+        for k, (rs, cs) in enumerate(parts, 1):
+            sub_supply, sub_demand = self.supply[rs], self.demand[cs]
+            if not sub_supply.any() and not sub_demand.any():
+                continue # Nothing to ship (e.g. a warehouse with no usable route and no stock)
+
+            self.log(f"=== Part {k}: {len(rs)} warehouses x {len(cs)} destinations ===", "header")
+            block = np.ix_(rs, cs)
+            # Original costs: the part picks its own big M for any forbidden cells it still has
+            sub_costs = np.where(self.forbidden[block], np.inf, self.costs[block])
+            sub = TransportationSolver(sub_costs, sub_supply, sub_demand,
+                                       on_log=self.on_log, teaching=self.teaching)
+            allocation, _, _ = sub.solve()
+            self.logs.extend(sub.logs)
+            self.allocation[block] = allocation
+            self.is_basic[block] = sub.is_basic
+
+        self.basic_count = int(self.is_basic.sum())
+        cost = self.calculate_total_cost()
+        return self.allocation, (round(cost) if self.round_cost else cost), self.logs
+
+    def solve_highs(self):
+        """Solves the transport LP in one call to SciPy's HiGHS solver"""
+        self.log("Solving transport LP with HiGHS (scipy.optimize.linprog)...", "header")
+        rows, cols = self.rows, self.cols
+
+        # Variable x[r, c] sits at column r * cols + c; it appears in exactly two
+        # equality rows: supply row r and demand row rows + c. Built directly in
+        # CSC (HiGHS' native format): two sorted row indices per column
+        n_vars = rows * cols
+        indices = np.empty((rows, cols, 2), np.int32)
+        indices[:, :, 0] = np.arange(rows)[:, None]
+        indices[:, :, 1] = rows + np.arange(cols)
+        A_eq = csc_matrix((np.ones(2 * n_vars), indices.ravel(), np.arange(0, 2 * n_vars + 1, 2)),
+                          shape=(rows + cols, n_vars))
+        b_eq = np.concatenate([self.supply, self.demand])
+
+        # Forbidden cells are pinned to 0 by their bounds; their (big M) cost is just a placeholder
+        bounds = np.zeros((n_vars, 2))
+        bounds[:, 1] = np.where(self.forbidden.ravel(), 0.0, np.inf)
+
+        res = linprog(self.costs.ravel(), A_eq=A_eq, b_eq=b_eq, bounds=bounds, method='highs')
+        if not res.success:
+            raise ValueError(f"HiGHS found no solution: {res.message}")
+        self.allocation[:] = res.x.reshape(rows, cols)
+        self.allocation[self.allocation < 1e-9] = 0.0 # Drop round-off residue from the LP solve
+        self.is_basic = self.allocation > 0
+        self.basic_count = int(self.is_basic.sum())
+        self.log("HiGHS reports an optimal solution.", "success")
+
+        cost = self.calculate_total_cost()
+        return self.allocation, (round(cost) if self.round_cost else cost), self.logs
+
+    def solve_modi(self):
+        """NWCM initial solution improved by MODI pivots, logging every step"""
+        self.log("Initializing Basic Feasible Solution (NWCM)...", "header")
+        self.nwcm()
+        initial_cost = self.calculate_total_cost()
+        self.log(f"Initial BFS Cost: ${initial_cost:.0f}", "bold")
+
+        # Fixed per problem: lower-bounds each row's opportunity costs in the pivot
+        row_min_cost = self.costs.min(axis=1)
+
+        iteration = 1
+        max_iterations = 100 # Safety break to prevent infinite loops
+        
+        while iteration < max_iterations:
+            self.log(f"--- Optimization Iteration {iteration} ---", "header")
+            
+            # 1. Check for Degeneracy
+            self.fix_degeneracy()
+
+            # 2.-6. Potentials, opportunity costs, optimality check, closed loop and
+            # theta shift run as one compiled pivot; only the outcome comes back for logging
+            status, min_d, r, c, theta = _modi_pivot(self.costs, row_min_cost, self.allocation, self.is_basic,
+                                                     self.forbidden)
+
+            if status == _DISCONNECTED:
+                self.log("Graph disconnected (Degeneracy error). Stopping.", "error")
+                break
+
+            if status == _OPTIMAL:
+                self.log("All opportunity costs >= 0. Solution is Optimal!", "success")
+                break
+
+            entering_cell = (int(r), int(c))
+
+            self.log(f"Negative opp. cost ({min_d:g}) at {entering_cell}. Improving...", "highlight")
+
+            if status == _NO_LOOP:
+                self.log("Error: Closed loop not found. This might be a complex degeneracy issue.", "error")
+                break
+
+            self.log(f"Shifting {theta:g} units along the loop.", "normal")
+
+            iteration += 1
+
+        cost = self.calculate_total_cost()
+        return self.allocation, (round(cost) if self.round_cost else cost), self.logs
+
+    def nwcm(self):
+        """North West Corner Method"""
+        # The NW corner walk allocates each cumulative-supply interval of row r against the
+        # cumulative-demand interval of column c, so every cell gets the overlap of the two
+        cum_supply = np.cumsum(self.supply)
+        cum_demand = np.cumsum(self.demand)
+        lo = np.maximum(np.r_[0, cum_supply[:-1]][:, None], np.r_[0, cum_demand[:-1]][None, :])
+        hi = np.minimum(cum_supply[:, None], cum_demand[None, :])
+        np.clip(hi - lo, 0, None, out=self.allocation)
+        self.is_basic[:] = self.allocation > 0
+        # One filled cell per gap between consecutive distinct breakpoints of the two prefix sums
+        self.basic_count = len(np.union1d(np.r_[0, cum_supply], np.r_[0, cum_demand])) - 1
+
+    def calculate_total_cost(self):
+        return float(np.einsum('ij,ij->', self.allocation, self.costs))
+
+    def fix_degeneracy(self):
+        """Ensures basic cells = m + n - 1 by making valid empty cells basic (at 0 units)"""
+        required = self.rows + self.cols - 1
+        needed = required - self.basic_count
+        if needed <= 0:
+            return
+
+        # Degeneracy detected. Promote the lowest cost empty cells that don't create a
+        # loop, so the basic cells stay a spanning tree of the warehouse/destination graph.
+        # Union-find over nodes: rows are 0..rows-1, columns are rows..rows+cols-1
+        parent = list(range(self.rows + self.cols))
+
+        def find(node):
+            while parent[node] != node:
+                parent[node] = parent[parent[node]]
+                node = parent[node]
+            return node
+
+        for r, c in np.argwhere(self.is_basic).tolist():
+            parent[find(r)] = find(self.rows + c)
+
+        # Empty cells sorted by cost (heuristic to pick 'sensible' dummy paths), with
+        # forbidden cells skipped unless no allowed cell is left to join the tree.
+        # argwhere is row-major and lexsort is stable, so ties keep (r, c) order.
+        empty_cells = np.argwhere(~self.is_basic)
+        er, ec = empty_cells[:, 0], empty_cells[:, 1]
+        order = np.lexsort((self.costs[er, ec], self.forbidden[er, ec]))
+        for r, c in empty_cells[order].tolist():
+            root_r, root_c = find(r), find(self.rows + c)
+            if root_r == root_c:
+                continue # Would close a loop with the current basis
+            parent[root_r] = root_c
+            self.is_basic[r, c] = True
+            self.basic_count += 1
+            needed -= 1
+            if needed == 0:
+                break